@@ -1,549 +1,641 @@
-# Author: Satyam Patel
-# Date: 12:53 PM 6/02/2021
-# Description: Implements the Kuba game.
-
-class Player:
-    """ 
-    Holds all data for a player object.
-    """
-    def __init__(self, player_info):
-        """
-        initializes the name, color and captured marbles for the player
-        """
-        self._name = player_info[0]
-        self._color = player_info[1]
-        self._captured = []
-
-    def get_name(self):
-        """ 
-        returns player name
-        """
-        return self._name
-
-    def get_color(self):
-        """
-        returns marble color of player
-        """
-        return self._color
-
-    def get_captured(self):
-        """
-        returns captured marbles of player
-        """
-        return self._captured
-
-    def capture(self, marble):
-        """
-        captures marble
-        """
-        self._captured.append(marble)
-    
-    def get_captured_count(self, color):
-        """
-        returns the number of input color marbles captured
-        """
-        count = 0
-        for marble in self._captured:
-            if marble == color:
-                count += 1
-        return count
-
-    def get_captured_counts(self):
-        """
-        returns a dict of the marble counts captured
-        """
-        counts = {"W":0, "B":0, "R":0}
-        for marble in self.get_captured():    
-            if marble in counts:
-                counts[marble] += 1
-        return counts
-
-
-class KubaGame:
-    """ 
-    Main class for the game. 
-    """
-
-    def __init__(self, player_a_info, player_b_info):
-        """ 
-        Initializes the game board and also maps players to their color. 
-        Initializes current player turn as well
-        Initializes game win state.
-        Initializes the board history list.
-        player_x_info needs to be passed in as a tuple: ("Name", "W") or ("Name", "B")
-        """
-        self._board = [['W','W','X','X','X','B','B'],
-                       ['W','W','X','R','X','B','B'],
-                       ['X','X','R','R','R','X','X'],
-                       ['X','R','R','R','R','R','X'],
-                       ['X','X','R','R','R','X','X'],
-                       ['B','B','X','R','X','W','W'],
-                       ['B','B','X','X','X','W','W']]
-
-        self._board_history = []
-        self._current_turn = None
-        self._winner = None
-
-        self._player_a = Player(player_a_info)
-        self._player_b = Player(player_b_info)
-
-        self._players = {self._player_a.get_name() : self._player_a, 
-                         self._player_b.get_name() : self._player_b}
-
-        self._error_messages = []
-
-    def get_board(self):
-        """ 
-        returns the board
-        """
-        return self._board
-
-    def _set_board(self, board):
-        """
-        sets the board to the passed in one
-        """
-        self._board = board
-
-    def get_board_history(self):
-        """
-        returns the board history
-        """
-        return self._board_history
-
-    def get_current_turn(self):
-        """
-        returns the name of the player whose turn it is. Returns None if no player has started yet
-        """
-        if self._current_turn is not None:
-            return self._current_turn.get_name()
-        else:
-            return None
-
-    def _set_current_turn(self, player):
-        """
-        sets the current turn of the game
-        """
-        self._current_turn = player
-
-    def get_player(self, playername):
-        """
-        returns player object from player name
-        """
-        return self._players[playername]
-
-    def get_players(self):
-        """
-        returns the entire player dict
-        """
-        return self._players
-
-    def get_player_a(self):
-        """
-        returns the player_a object
-        """
-        return self._player_a
-
-    def get_player_b(self):
-        """
-        returns the player_b object
-        """
-        return self._player_b
-
-    def get_winner(self):
-        """
-        Returns the name of the winner of the game.
-        Returns None if no winner yet.
-        """
-        if self._winner is not None:
-            return self._winner.get_name()
-        return None
-
-    def _set_winner(self, player):
-        """
-        sets the winner of the game
-        """
-        self._winner = player
-
-    def get_captured(self, playername):
-        """
-        Returns the number of red marbles captured by this player.
-        """
-
-        return self.get_player(playername).get_captured_count("R")
-
-    def get_marble(self, coordinates):
-        """
-        Returns the marble at this coordinate
-        Returns X if no marble is present.
-        """
-        return self.get_board()[coordinates[0]][coordinates[1]]
-
-    def get_marble_count(self):
-        """
-        returns the number of white, black, and red marbles in a tuple.
-        (W,B,R)
-        """
-        counts = {"W":0, "B":0, "R":0}
-
-        for row in self.get_board():
-            for marble in row:
-                if marble in counts:
-                    counts[marble] += 1
-
-        return (counts["W"], counts["B"], counts["R"])
-
-    def print_board(self):
-        """
-        Prints out the board to the console.
-        """
-        print("      0  1  2  3  4  5  6")
-        row_num = 0
-        for row in self.get_board():
-            print("   ", row_num, "", end="")
-            row_num += 1
-            for marble in row:
-                char = marble
-                if marble == "X":
-                    char = "■"
-                print(char, end="  ")
-            print()
-    
-    def _document_error(self, message):
-        """
-        pushes message to the error stack
-        """
-        self._error_messages.append(message)
-
-    def pop_error(self):
-        """
-        pops the last error message
-        """
-        return self._error_messages.pop()
-
-    def _is_valid_push(self, coordinates, direction, player_marble):
-        """ 
-        checks if we can move in this direction at the given coordinates
-        Note this function is called in a larger validation function: _move_is_valid()
-        """
-        # coordinates of interest
-        right      = (coordinates[0], coordinates[1]+1) # immediately right
-        left       = (coordinates[0], coordinates[1]-1) # immediately left
-        above      = (coordinates[0]-1, coordinates[1]) # immediately above
-        below      = (coordinates[0]+1, coordinates[1]) # immediately below
-        leftmost   = (coordinates[0], 0) # the leftmost extreme of this row
-        rightmost  = (coordinates[0], 6) # the rightmost extreme of row
-        topmost    = (0, coordinates[1]) # the topmost extreme of column
-        bottommost = (6, coordinates[1]) # the bottommost extreme of column
-
-        def helper(coord_index, extreme_index, immediate, extreme):
-            """
-            helper that consolidates the checks into one function
-            """
-            row_or_col = []
-            slice = []
-
-            if coord_index == 0:
-                row_or_col = self._get_column(coordinates[1])
-            else:
-                row_or_col = self._get_row(coordinates[0])
-
-            if (extreme_index < coordinates[coord_index]):
-                slice = row_or_col[coordinates[coord_index]:]
-            else:
-                slice = row_or_col[:coordinates[coord_index]]
-
-            if player_marble == self.get_marble(extreme) and "X" not in slice:
-                self._document_error("You cannot capture your own marble!")
-                return False
-            if coordinates[coord_index] == extreme_index:
-                return True
-            if self.get_marble(immediate) == "X":
-                return True
-            else:
-                self._document_error("Cant push from this direction!")
-                return False
-
-        if direction == "L":
-            return helper(1, 6, right, leftmost)
-
-        if direction == "R":
-            return helper(1, 0, left, rightmost)
-
-        if direction == "B":
-            return helper(0, 0, above, bottommost)
-
-        if direction == "F":
-            return helper(0, 6, below, topmost)
-
-    def _move_is_valid(self, playername, coordinates, direction):
-        """
-        Validates move by checking:
-        if game is already won,
-        if it is the players turn or first move,
-        if coordinates has current players marble color,
-        if move can be made at all in given direction,
-        """
-        invalid_direction = direction not in "FBLR"
-        if invalid_direction:
-            self._document_error("Not a valid direction: F,B,L,R")
-            return False
-
-        invalid_player = playername not in self.get_players()
-        if invalid_player:
-            self._document_error("Player doesn't exist!")
-            return False
-
-        already_won = self.get_winner() != None
-        if already_won:
-            self._document_error("A player has already won: " + self.get_winner())
-            return False
-
-        coords_in_range = 0 <= coordinates[0] <= 6 and 0 <= coordinates[1] <= 6
-        if not coords_in_range:
-            self._document_error("Coordinates are not in range!")
-            return False
-
-        not_player_turn = False
-        if self.get_current_turn() != None:
-            not_player_turn = playername != self.get_current_turn()
-        if not_player_turn:
-            self._document_error("Not your turn. Current turn: " + self.get_current_turn())
-            return False
-
-        not_player_marble = self.get_marble(coordinates) != self.get_player(playername).get_color()
-        if not_player_marble:
-            self._document_error("Not your marble!")
-            return False        
-
-        cant_push = not self._is_valid_push(coordinates, direction, self.get_player(playername).get_color())
-        if cant_push:
-            self._document_error("Cant push because: " + self.pop_error())
-            return False
-
-        return True
-
-    def _check_win_conditions(self):
-        """
-        Checks to see if any of the players have 7 reds or 8 of the opponents marbles.
-        """
-        for playername, player in self.get_players().items():            
-            red_count   = player.get_captured_count("R")
-            black_count = player.get_captured_count("B")
-            white_count = player.get_captured_count("W")
-            if red_count == 7:
-                self._set_winner(player)
-                return
-            elif black_count == 8:
-                self._set_winner(player)
-                return
-            elif white_count == 8:
-                self._set_winner(player)    
-                return
-            #elif not self._are_moves_available(player):
-            #    player_a = self.get_player_a()
-            #    player_b = self.get_player_b()
-            #    if player_a.get_name() != playername:
-            #        self._set_winner(player_a)
-            #    else:
-            #        self._set_winner(player_b)       
-
-    def _replace_column(self, column_index, column, board):
-        """
-        replaces the column in the board at column_index with the given column
-        """
-        row_num = 0
-        for row in board:
-            row[column_index] = column[row_num]
-            row_num += 1
-
-    def _replace_row(self, row_index, row, board):
-        """
-        replaces the row in the board at row_index with the given row
-        """
-        board[row_index] = list(row)
-
-    def _get_row(self, row_index):
-        """ 
-        returns the row at row_index of the board
-        """
-        return list(self.get_board()[row_index])
-
-    def _get_column(self, column_index):
-        """
-        returns the column at the column_index of the board
-        """
-        return [row[column_index] for row in self.get_board()]
-
-    def _is_same_board(self, board_1, board_2):
-        """
-        returns true if board_1 matches board_2
-        """
-        for index in range(len(board_1)):
-            if board_1[index] != board_2[index]:
-                return False
-        return True
-
-    def _copy_board(self, board):
-        """
-        returns a copy of the input board
-        """
-        copy = []
-        for row in board:
-            copy.append(list(row))
-        return copy
-
-    def _push_right(self, position, a_list):
-        """
-        takes a list and pushes the element to the right. If there is something there, it pushes that element as well. 
-        If an element gets pushed out of the list we return that
-        """
-        for index in range(position, len(a_list)):
-            if a_list[index] == "X":
-                a_list.pop(index)
-                a_list.insert(position,"X")
-                return None
-        a_list.insert(position, "X")
-        return a_list.pop()
-
-    def _set_next_turn(self, current_player):
-        """
-        Sets the next turn of the game
-        """
-        if current_player == self.get_player_a():
-            self._set_current_turn(self.get_player_b())
-        else:
-            self._set_current_turn(self.get_player_a())
-
-    def _are_moves_available(self, player):
-        """ 
-        returns true if there is at least one move available for this player 
-        """
-        moves = "LRFB"
-        name = player.get_name()
-        player_marble = player.get_color()
-
-        for row_index, row in enumerate(self.get_board()):
-            for col_index, marble in enumerate(row):
-                if marble == player_marble:
-                    for move in moves:
-                        if self._move_is_valid(name, (row_index, col_index), move):
-                            return True
-        return False
-
-    def make_move(self, playername, coordinates, direction):
-        """ 
-        Win conditions are analyzed.
-        Attempts to make a move for playername at coordinates in direction.
-        If initial validation passes, we make the move on a copy of the current 
-        board and compare it to the board 1 move prior.
-        If move is unique: the board, current turn, and captured marbles for current 
-        player are updated. 
-        Player turn is updated (no repeated turns for our implementation).
-        """
-        self._check_win_conditions()
-
-        if (not self._move_is_valid(playername, coordinates, direction)):
-            return False
-        
-        # make copy of board
-        board_copy = self._copy_board(self.get_board())
-        captured = None
-
-        # make move on the copy
-        if direction == "R":
-            row_index = coordinates[0]
-            row = self._get_row(row_index)
-            captured = self._push_right(coordinates[1], row)
-            self._replace_row(row_index, row, board_copy)
-
-        elif direction == "B":
-            column_index = coordinates[1]
-            column = self._get_column(column_index)
-            captured = self._push_right(coordinates[0], column)
-            self._replace_column(column_index, column, board_copy)
-
-        elif direction == "L":
-            row_index = coordinates[0]
-            row = self._get_row(row_index)
-            row.reverse()
-            captured = self._push_right(6 - coordinates[1], row)
-            row.reverse()
-            self._replace_row(row_index, row, board_copy)
-
-        elif direction == "F":
-            column_index = coordinates[1]
-            column = self._get_column(column_index)
-            column.reverse()
-            captured = self._push_right(6 - coordinates[0], column)
-            column.reverse()
-            self._replace_column(column_index, column, board_copy)      
-
-        # check if the copy is the same as the last board
-        history = self.get_board_history()
-        if len(history) > 1:
-            if self._is_same_board(history[-2], board_copy):
-                self._document_error("Cannot make a circular move!")
-                return False
-        
-        # set the board and capture marble!
-        if captured is not None:
-            self.get_player(playername).capture(captured)
-        self._set_board(board_copy)
-        history.append(board_copy)
-        self._set_next_turn(self.get_player(playername))
-        return True
-
-# uncomment the lines below to play the game in the console!
-
-def play_game():
-    print("Welcome to the Kuba Game!")
-    print("Enter q to quit during game loop.")
-    print('All inputs need to be in the form "name row,col direction"')
-    print('Valid directions are: R,L,F,B')
-    print("Player 1 has black marbles and Player 2 has white marbles.")
-
-    player_1 = input("Player 1 Name: ")
-    player_2 = input("Player 2 Name: ")
-
-    kg = KubaGame((player_1,'B'),(player_2, 'W'))
-    kg.print_board()
-
-    while(kg.get_winner() == None):
-        # prompt user for moves
-        user_input = input("name row,col direction: ")
-        if user_input.lower() == "q":
-            return
-        inputs = user_input.split(' ')
-        name = ""
-        position = (0,0)
-        direction = "F"
-        try:
-            name = inputs[0]
-            position = eval(inputs[1])
-            if len(position) != 2:
-                print("invalid input!")
-                continue
-            direction = inputs[2]
-        except:
-            print("Input invalid!")
-            continue
-
-        if not kg.make_move(name, position, direction):
-            print()
-            kg.print_board()
-            print()
-            print(kg.get_player_a().get_name(), " has: ", kg.get_player_a().get_captured_counts())
-            print(kg.get_player_b().get_name(), " has: ", kg.get_player_b().get_captured_counts())
-            print()
-            print(kg.pop_error())
-        else:
-            print()
-            kg.print_board()
-            print()
-            print(kg.get_player_a().get_name(), " has: ", kg.get_player_a().get_captured_counts())
-            print(kg.get_player_b().get_name(), " has: ", kg.get_player_b().get_captured_counts())
-    print()
-    print("WINNER: ", kg.get_winner())
-
-if __name__ == "__main__":
-    play_game()
+# Author: Satyam Patel
+# Date: 12:53 PM 6/02/2021
+# Description: Implements the Kuba game.
+
+import random
+from collections import deque
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """
+        stand-in for numba.njit when numba is not installed: returns the function unchanged
+        """
+        def decorator(function):
+            return function
+        return decorator
+
+# Marbles are small ints internally and letters at the public API: "XWBR"[marble].
+X, W, B, R = 0, 1, 2, 3
+_MARBLES = "XWBR"
+_MARBLE_INDEX = {"X":X, "W":W, "B":B, "R":R}
+_MARBLE_BYTES = bytes.maketrans(bytes(range(4)), _MARBLES.encode())
+
+# The board is stored as three 49 bit integers (bitboards), one per marble color.
+# Cell (row, col) is bit row*7 + col.
+BOARD_SIZE = 7
+BOARD_MASK = (1 << 49) - 1
+LANE_MASK = 0x7F
+ROW_MASK = tuple(LANE_MASK << (row * 7) for row in range(BOARD_SIZE))
+COL_MASK = tuple(sum(1 << (row * 7 + col) for row in range(BOARD_SIZE)) for col in range(BOARD_SIZE))
+FIRST_COLUMN = COL_MASK[0]
+
+_INITIAL_BOARD = ("WWXXXBB",
+                  "WWXRXBB",
+                  "XXRRRXX",
+                  "XRRRRRX",
+                  "XXRRRXX",
+                  "BBXRXWW",
+                  "BBXXXWW")
+
+
+def _bitboard(layout, marble):
+    """
+    returns the bitboard of the given marble in a layout of 7 strings
+    """
+    bitboard = 0
+    for row_index, row in enumerate(layout):
+        for col_index, cell in enumerate(row):
+            if cell == marble:
+                bitboard |= 1 << (row_index * 7 + col_index)
+    return bitboard
+
+
+# error messages, indexed by the error codes below (0 means no error)
+_ERRORS = (None,
+           "Not a valid direction: F,B,L,R",
+           "Player doesn't exist!",
+           "Coordinates are not in range!",
+           "Not your marble!",
+           "Cant push because: You cannot capture your own marble!",
+           "Cant push because: Cant push from this direction!",
+           "Cannot make a circular move!")
+
+_ERR_DIRECTION           = 1
+_ERR_PLAYER              = 2
+_ERR_RANGE               = 3
+_ERR_MARBLE              = 4
+_ERR_CANT_PUSH_OWN       = 5
+_ERR_CANT_PUSH_DIRECTION = 6
+_ERR_CIRCULAR            = 7
+# messages naming a player are built per game and follow _ERRORS, add the player index
+_ERR_WON                 = len(_ERRORS)
+_ERR_TURN                = _ERR_WON + 2
+
+# the error stack only keeps the latest errors
+_MAX_ERRORS = 64
+
+
+# direction -> (axis, step, extreme)
+# axis is the index of the coordinate the push moves along (0 for F/B, 1 for L/R),
+# step is +1 toward index 6 or -1 toward index 0 and extreme is the index of the edge pushed toward
+_DIRS = {"L": (1, -1, 0),
+         "R": (1,  1, 6),
+         "F": (0, -1, 0),
+         "B": (0,  1, 6)}
+
+
+def _shift(bitboard, step):
+    """
+    moves every cell of the bitboard step bits up (or down if negative), dropping cells that leave the board
+    """
+    if step > 0:
+        return (bitboard << step) & BOARD_MASK
+    return bitboard >> -step
+
+
+def _zobrist_keys(seed):
+    """
+    returns a table of random 64 bit keys, one per cell and color (W, B, R).
+    The same seed always gives the same table.
+    """
+    rng = random.Random(seed)
+    return tuple(tuple(rng.getrandbits(64) for _ in range(3)) for _ in range(BOARD_SIZE * BOARD_SIZE))
+
+
+# cell -> (W, B, R) keys, XORed together for every marble on the board to hash it
+_ZOBRIST = _zobrist_keys(7)
+
+
+def _zobrist_update(key, old_board, new_board):
+    """
+    returns the zobrist key of new_board given the key of old_board (both (W,B,R) bitboard tuples).
+    Only the cells that changed are XORed in or out.
+    """
+    for color in range(3):
+        changed = old_board[color] ^ new_board[color]
+        while changed:
+            cell = changed & -changed
+            key ^= _ZOBRIST[cell.bit_length() - 1][color]
+            changed ^= cell
+    return key
+
+
+@njit(cache=True)
+def _highest_bit(bits):
+    """
+    returns only the highest set bit of bits (0 if bits is 0)
+    """
+    while bits & (bits - 1):
+        bits &= bits - 1
+    return bits
+
+
+@njit(cache=True)
+def _apply_move_bb(white, black, red, row, col, axis, step, color):
+    """
+    checks and makes the push of the marble at (row, col) on the white, black and red bitboards
+    in a single pass over the line.
+    axis and step are the ones of the direction in _DIRS and color is the moving player's marble.
+    If there is something there, it pushes that marble as well.
+    Returns the new white, black and red bitboards, the marble that got pushed off the board
+    (X if none) and the push error code (0 if none).
+    On an error the bitboards are returned unchanged.
+    """
+    start = 1 << (row * 7 + col)
+    if axis:
+        line, stride = LANE_MASK << (row * 7), 1
+    else:
+        line, stride = FIRST_COLUMN << col, 7
+    first = line & -line                      # first cell of the line
+    last = first << (6 * stride)              # last cell of the line
+
+    occupied = white | black | red
+    empty = ~occupied & line
+    if step > 0:
+        back, edge, behind = first, last, start >> stride
+        empty &= -start                       # empty cells at or after start
+        target = empty & -empty               # the nearest one
+    else:
+        back, edge, behind = last, first, start << stride
+        empty &= (start << 1) - 1             # empty cells at or before start
+        target = _highest_bit(empty)          # the nearest one
+
+    captured = X
+    if not empty:
+        # the line is full up to the edge, the edge marble falls off
+        target = edge
+        if white & edge:
+            captured = W
+        elif black & edge:
+            captured = B
+        elif red & edge:
+            captured = R
+        if captured == color:
+            return white, black, red, X, _ERR_CANT_PUSH_OWN
+    if start != back and occupied & behind:
+        return white, black, red, X, _ERR_CANT_PUSH_DIRECTION
+
+    if captured:
+        white, black, red = white & ~edge, black & ~edge, red & ~edge
+
+    # every marble from start up to the target cell moves one step
+    step *= stride
+    if step > 0:
+        moving = line & (target - start)
+        white = (white & ~moving) | ((white & moving) << step)
+        black = (black & ~moving) | ((black & moving) << step)
+        red   = (red & ~moving) | ((red & moving) << step)
+    else:
+        moving = line & ((start << 1) - (target << 1))
+        white = (white & ~moving) | ((white & moving) >> -step)
+        black = (black & ~moving) | ((black & moving) >> -step)
+        red   = (red & ~moving) | ((red & moving) >> -step)
+    return white, black, red, captured, 0
+
+
+class Player:
+    """ 
+    Holds all data for a player object.
+    """
+    def __init__(self, player_info):
+        """
+        initializes the name, color and captured marbles for the player,
+        along with a running count of captured marbles per color.
+        Colors are stored as marble ints, counts as a list indexed by them.
+        """
+        self._name = player_info[0]
+        self._color = _MARBLE_INDEX.get(player_info[1], X)
+        self._captured = []
+        self._counts = [0, 0, 0, 0]
+
+    def get_name(self):
+        """ 
+        returns player name
+        """
+        return self._name
+
+    def get_color(self):
+        """
+        returns marble color of player
+        """
+        return _MARBLES[self._color]
+
+    def get_captured(self):
+        """
+        returns captured marbles of player
+        """
+        return [_MARBLES[marble] for marble in self._captured]
+
+    def capture(self, marble):
+        """
+        captures marble
+        """
+        marble = _MARBLE_INDEX[marble]
+        self._captured.append(marble)
+        self._counts[marble] += 1
+    
+    def get_captured_count(self, color):
+        """
+        returns the number of input color marbles captured
+        """
+        return self._counts[_MARBLE_INDEX.get(color, X)]
+
+    def get_captured_counts(self):
+        """
+        returns a dict of the marble counts captured
+        """
+        counts = self._counts
+        return {"W":counts[W], "B":counts[B], "R":counts[R]}
+
+
+class KubaGame:
+    """ 
+    Main class for the game. 
+    """
+
+    def __init__(self, player_a_info, player_b_info):
+        """ 
+        Initializes the game board and the per player name, color and capture fields. 
+        Initializes current player turn as well
+        Initializes game win state.
+        Initializes the board history list of (W,B,R) bitboard tuples and their zobrist keys.
+        player_x_info needs to be passed in as a tuple: ("Name", "W") or ("Name", "B")
+        """
+        self._white = _bitboard(_INITIAL_BOARD, "W")
+        self._black = _bitboard(_INITIAL_BOARD, "B")
+        self._red   = _bitboard(_INITIAL_BOARD, "R")
+
+        self._board_history = []
+        self._zobrist = _zobrist_update(0, (0, 0, 0), (self._white, self._black, self._red))
+        self._zobrist_history = []
+        # the players are stored as parallel per player fields, indexed 0 (player a) or 1 (player b)
+        self._names = (player_a_info[0], player_b_info[0])
+        self._colors = (_MARBLE_INDEX.get(player_a_info[1], X), _MARBLE_INDEX.get(player_b_info[1], X))
+        self._player_index = {self._names[0] : 0, self._names[1] : 1}
+        self._captured = ([], [])
+        self._red_caps = [0, 0]
+        self._opp_caps = [0, 0]
+
+        # index of the player whose turn it is / who won, None if no one
+        self._current_turn = None
+        self._winner = None
+
+        # error code stack, with the messages naming a player appended to the error table
+        self._error_codes = deque(maxlen=_MAX_ERRORS)
+        self._error_table = (_ERRORS
+                             + tuple("A player has already won: {}".format(name) for name in self._names)
+                             + tuple("Not your turn. Current turn: {}".format(name) for name in self._names))
+
+    def get_board(self):
+        """
+        returns the board as a 7x7 list of marbles
+        """
+        return self._board_from_bitboards((self._white, self._black, self._red))
+
+    def _board_cells(self, board):
+        """
+        returns the 49 cells of a (W,B,R) bitboard tuple as a row major bytearray of marble ints
+        """
+        cells = bytearray(BOARD_SIZE * BOARD_SIZE)
+        for marble, bitboard in zip((W, B, R), board):
+            while bitboard:
+                cell = bitboard & -bitboard
+                cells[cell.bit_length() - 1] = marble
+                bitboard ^= cell
+        return cells
+
+    def _board_from_bitboards(self, board):
+        """
+        returns a 7x7 list of marbles built from a (W,B,R) bitboard tuple
+        """
+        letters = self._board_cells(board).translate(_MARBLE_BYTES).decode()
+        return [list(letters[row_index * 7:row_index * 7 + 7]) for row_index in range(BOARD_SIZE)]
+
+    def get_board_history(self):
+        """
+        returns the board history, oldest board first
+        """
+        return [self._board_from_bitboards(board) for board in self._board_history]
+
+    def get_current_turn(self):
+        """
+        returns the name of the player whose turn it is. Returns None if no player has started yet
+        """
+        if self._current_turn is not None:
+            return self._names[self._current_turn]
+        else:
+            return None
+
+    def _make_player(self, index):
+        """
+        returns a Player object for the player at index, built from the game's player fields
+        """
+        player = Player((self._names[index], _MARBLES[self._colors[index]]))
+        for marble in self._captured[index]:
+            player.capture(_MARBLES[marble])
+        return player
+
+    def get_player(self, playername):
+        """
+        returns player object from player name
+        """
+        return self._make_player(self._player_index[playername])
+
+    def get_players(self):
+        """
+        returns the entire player dict
+        """
+        return {playername : self._make_player(index) for playername, index in self._player_index.items()}
+
+    def get_player_a(self):
+        """
+        returns the player_a object
+        """
+        return self._make_player(0)
+
+    def get_player_b(self):
+        """
+        returns the player_b object
+        """
+        return self._make_player(1)
+
+    def get_winner(self):
+        """
+        Returns the name of the winner of the game.
+        Returns None if no winner yet.
+        """
+        if self._winner is not None:
+            return self._names[self._winner]
+        return None
+
+    def _set_winner(self, index):
+        """
+        sets the winner of the game to the player at index
+        """
+        self._winner = index
+
+    def get_captured(self, playername):
+        """
+        Returns the number of red marbles captured by this player.
+        """
+
+        return self._red_caps[self._player_index[playername]]
+
+    def get_marble(self, coordinates):
+        """
+        Returns the marble at this coordinate
+        Returns X if no marble is present.
+        Coordinates index the board like the 7x7 list of get_board().
+        """
+        row_index, column_index = coordinates
+        if not (-7 <= row_index < 7 and -7 <= column_index < 7):
+            raise IndexError("list index out of range")
+        bit = row_index % 7 * 7 + column_index % 7
+        # at most one of the three bits is set, so this is W (1), B (2), R (3) or X (0)
+        marble = ((self._white >> bit) & 1) | ((self._black >> bit) & 1) << 1 | ((self._red >> bit) & 1) * R
+        return _MARBLES[marble]
+
+    def get_marble_count(self):
+        """
+        returns the number of white, black, and red marbles in a tuple.
+        (W,B,R)
+        """
+        return (self._white.bit_count(), self._black.bit_count(), self._red.bit_count())
+
+    def _get_player_bitboard(self, index):
+        """
+        returns the bitboard of the marbles of the player at index
+        """
+        color = self._colors[index]
+        if color == W:
+            return self._white
+        if color == B:
+            return self._black
+        if color == R:
+            return self._red
+        return 0
+
+    def _get_occupied(self):
+        """
+        returns the bitboard of every cell that holds a marble
+        """
+        return self._white | self._black | self._red
+
+    def print_board(self):
+        """
+        Prints out the board to the console.
+        """
+        print("      0  1  2  3  4  5  6")
+        row_num = 0
+        for row in self.get_board():
+            print("   ", row_num, "", end="")
+            row_num += 1
+            for marble in row:
+                char = marble
+                if marble == "X":
+                    char = "■"
+                print(char, end="  ")
+            print()
+    
+    def _document_error(self, code):
+        """
+        pushes the error code to the error stack
+        """
+        self._error_codes.append(code)
+
+    def pop_error(self):
+        """
+        pops the last error message
+        """
+        return self._error_table[self._error_codes.pop()]
+
+    def _capture(self, index, marble):
+        """
+        Records the marble (int) captured by the player at index.
+        Checks to see if that capture gave the player 7 reds or 8 of the opponents marbles.
+        """
+        self._captured[index].append(marble)
+        if marble == R:
+            self._red_caps[index] += 1
+            if self._red_caps[index] == 7:
+                self._set_winner(index)
+        else:
+            self._opp_caps[index] += 1
+            if self._opp_caps[index] == 8:
+                self._set_winner(index)
+
+    def _are_moves_available(self, index):
+        """ 
+        returns true if there is at least one move available for the player at index.
+        Whose turn it is and the circular move rule are not taken into account.
+        All marbles are tested at once, one direction at a time.
+        """
+        player_bitboard = self._get_player_bitboard(index)
+        occupied = self._get_occupied()
+        empty = ~occupied & BOARD_MASK
+
+        for axis, step, extreme_index in _DIRS.values():
+            # bit step of a cell toward the push, edge pushed away from and edge pushed toward
+            if axis:
+                back_edge, front_edge = COL_MASK[6 - extreme_index], COL_MASK[extreme_index]
+            else:
+                back_edge, front_edge = ROW_MASK[6 - extreme_index], ROW_MASK[extreme_index]
+                step *= 7
+            # marbles on the back edge or with an empty cell behind them
+            movable = player_bitboard & (back_edge | (_shift(empty, step) & ~back_edge))
+            if not movable:
+                continue
+
+            # marbles with an unbroken line up to one of the player's own marbles on the front edge
+            blocked = player_bitboard & front_edge
+            chain = blocked
+            while chain:
+                chain = _shift(chain, -step) & occupied & ~front_edge & ~blocked
+                blocked |= chain
+
+            if movable & ~blocked:
+                return True
+        return False
+
+    def _move_error(self, index, coordinates, direction):
+        """
+        O(1) check of everything but the push itself for a move of the player at index (None if the
+        player doesn't exist), in order:
+        a valid direction, an existing player, no winner yet, coordinates in range,
+        the player's turn or first move and the player's marble at coordinates.
+        Returns the error code of the first check that fails, 0 if they all pass.
+        """
+        if direction not in _DIRS:
+            return _ERR_DIRECTION
+        if index is None:
+            return _ERR_PLAYER
+        winner = self._winner
+        if winner is not None:
+            return _ERR_WON + winner
+        row_index, column_index = coordinates
+        if not (0 <= row_index <= 6 and 0 <= column_index <= 6):
+            return _ERR_RANGE
+        current = self._current_turn
+        if current is not None and current != index:
+            return _ERR_TURN + current
+        if not (self._get_player_bitboard(index) >> (row_index * 7 + column_index)) & 1:
+            return _ERR_MARBLE
+        return 0
+
+    def _make_move_unchecked(self, index, coordinates, direction):
+        """
+        Makes the move for the player at index, whose turn and marble must already be validated.
+        The push is checked and made on a new (W,B,R) bitboard tuple in one pass,
+        then compared to the board 1 move prior.
+        Returns False if the push is not allowed or the move is circular,
+        otherwise the move is finalized and True is returned.
+        """
+        axis, step, _ = _DIRS[direction]
+        white, black, red, captured, error = _apply_move_bb(
+            self._white, self._black, self._red, coordinates[0], coordinates[1],
+            axis, step, self._colors[index])
+        if error:
+            self._document_error(error)
+            return False
+        new_board = (white, black, red)
+        new_key = _zobrist_update(self._zobrist, (self._white, self._black, self._red), new_board)
+
+        # check if the new board is the same as the board 1 move prior
+        # (the keys are compared first, the boards only to rule out a hash collision)
+        history = self._board_history
+        if len(history) > 1 and self._zobrist_history[-2] == new_key and history[-2] == new_board:
+            self._document_error(_ERR_CIRCULAR)
+            return False
+
+        self._finalize_move(index, new_board, new_key, captured)
+        return True
+
+    def _finalize_move(self, index, new_board, new_key, captured):
+        """
+        Sets the board, history and turn after a move of the player at index
+        and records the captured marble (X if none).
+        """
+        self._white, self._black, self._red = new_board
+        self._zobrist = new_key
+        self._board_history.append(new_board)
+        self._zobrist_history.append(new_key)
+        self._current_turn = 1 - index
+        if captured:
+            self._capture(index, captured)
+
+    def make_move(self, playername, coordinates, direction):
+        """ 
+        Attempts to make a move for playername at coordinates in direction.
+        Turn and marble are checked quickly, the push is checked while it is made
+        on a new (W,B,R) bitboard tuple, which is then compared to the board 1 move prior.
+        The first check that fails documents its error.
+        If move is unique: the board, current turn, and captured marbles for current 
+        player are updated. 
+        Player turn is updated (no repeated turns for our implementation).
+        Win conditions are analyzed if a marble was captured.
+        """
+        index = self._player_index.get(playername)
+        error = self._move_error(index, coordinates, direction)
+        if error:
+            self._document_error(error)
+            return False
+
+        return self._make_move_unchecked(index, coordinates, direction)
+
+# uncomment the lines below to play the game in the console!
+
+def play_game():
+    print("Welcome to the Kuba Game!")
+    print("Enter q to quit during game loop.")
+    print('All inputs need to be in the form "name row,col direction"')
+    print('Valid directions are: R,L,F,B')
+    print("Player 1 has black marbles and Player 2 has white marbles.")
+
+    player_1 = input("Player 1 Name: ")
+    player_2 = input("Player 2 Name: ")
+
+    kg = KubaGame((player_1,'B'),(player_2, 'W'))
+    kg.print_board()
+
+    while(kg.get_winner() == None):
+        # prompt user for moves
+        user_input = input("name row,col direction: ")
+        if user_input.lower() == "q":
+            return
+        inputs = user_input.split(' ')
+        name = ""
+        position = (0,0)
+        direction = "F"
+        try:
+            name = inputs[0]
+            coords = inputs[1].split(",")
+            if len(coords) != 2:
+                print("invalid input!")
+                continue
+            position = (int(coords[0]), int(coords[1]))
+            direction = inputs[2]
+        except:
+            print("Input invalid!")
+            continue
+
+        if not kg.make_move(name, position, direction):
+            print()
+            kg.print_board()
+            print()
+            print(kg.get_player_a().get_name(), " has: ", kg.get_player_a().get_captured_counts())
+            print(kg.get_player_b().get_name(), " has: ", kg.get_player_b().get_captured_counts())
+            print()
+            print(kg.pop_error())
+        else:
+            print()
+            kg.print_board()
+            print()
+            print(kg.get_player_a().get_name(), " has: ", kg.get_player_a().get_captured_counts())
+            print(kg.get_player_b().get_name(), " has: ", kg.get_player_b().get_captured_counts())
+    print()
+    print("WINNER: ", kg.get_winner())
+
+if __name__ == "__main__":
+    play_game()